@@ -9,10 +9,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "typer>=0.9.0",
+        "orjson>=3.10",
     ],
     entry_points={
         "console_scripts": [
-            "todo=todo_cli.main:app",
+            "todo=todo_cli.main:main",
         ],
     },
     python_requires=">=3.9",
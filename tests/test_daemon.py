@@ -0,0 +1,254 @@
+"""
+Slack API デーモンのテスト
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from todo_cli.services import daemon
+from todo_cli.services.slack_service import SlackAPIError, SlackReactionItem
+
+ITEM = SlackReactionItem(
+    message_url="https://example.slack.com/archives/C1/p1",
+    title="hello",
+    timestamp=1.5,
+    channel_id="C1",
+    message_ts="1.5",
+)
+
+
+class FakeSlackService:
+    """Slack APIを呼ばないSlackService（呼び出しを記録する）"""
+
+    calls = []
+
+    def __init__(self, token, cache_pages=False):
+        self.token = token
+        self.cache_pages = cache_pages
+
+    def list_reactions(self, emoji="eyes", page_limit=200, max_pages=5):
+        self.calls.append((self, "list_reactions"))
+        return [ITEM], True
+
+    def remove_reaction(self, emoji, channel, timestamp):
+        self.calls.append((self, "remove_reaction"))
+        return True
+
+
+def _executed_by(service, fake_slack):
+    """呼び出しを実行したインスタンス（"daemon" またはプロセス内の "local"）とトークン"""
+    return [
+        ("local" if instance is service.local else "daemon", instance.token, method)
+        for instance, method in fake_slack.calls
+    ]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.02)
+
+
+def _send_raw(socket_path, data):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(5)
+    with client:
+        client.connect(str(socket_path))
+        client.sendall(data)
+        return daemon._recv_line(client)
+
+
+@pytest.fixture
+def fake_slack(monkeypatch):
+    monkeypatch.setattr(daemon, "SlackService", FakeSlackService)
+    FakeSlackService.calls = []
+    return FakeSlackService
+
+
+@pytest.fixture
+def running_daemon(fake_slack, tmp_path):
+    """トークン "tok" で起動したデーモンのソケットパス"""
+    socket_path = tmp_path / "todo.sock"
+    thread = threading.Thread(target=daemon.serve, args=("tok", socket_path), daemon=True)
+    thread.start()
+    _wait_for(lambda: daemon.is_running(socket_path))
+    return socket_path
+
+
+class TestDaemonProtocol:
+    """デーモンのリクエスト処理"""
+
+    def test_list_reactions_roundtrips_truncated(self, running_daemon, fake_slack):
+        service = daemon.DaemonSlackService("tok", running_daemon)
+
+        assert service.list_reactions() == ([ITEM], True)
+        assert _executed_by(service, fake_slack) == [("daemon", "tok", "list_reactions")]
+
+    def test_remove_reaction_via_daemon(self, running_daemon, fake_slack):
+        service = daemon.DaemonSlackService("tok", running_daemon)
+
+        assert service.remove_reaction("eyes", "C1", "1.5") is True
+        assert _executed_by(service, fake_slack) == [("daemon", "tok", "remove_reaction")]
+
+    def test_page_cache_enabled_only_in_daemon(self, running_daemon, fake_slack):
+        service = daemon.DaemonSlackService("tok", running_daemon)
+        service.list_reactions()
+
+        [(instance, _)] = fake_slack.calls
+        assert instance.cache_pages is True
+        assert service.local.cache_pages is False
+
+    def test_token_mismatch_falls_back_to_local(self, running_daemon, fake_slack):
+        with pytest.raises(daemon.DaemonUnavailableError):
+            daemon.call("list_reactions", {}, "other", running_daemon)
+
+        service = daemon.DaemonSlackService("other", running_daemon)
+        assert service.list_reactions() == ([ITEM], True)
+        assert _executed_by(service, fake_slack) == [("local", "other", "list_reactions")]
+
+    def test_unknown_method(self, running_daemon):
+        with pytest.raises(SlackAPIError, match="unknown method"):
+            daemon.call("test_connection", {}, "tok", running_daemon)
+
+    @pytest.mark.parametrize("request_line, error", [
+        (b"[1, 2]\n", "invalid request"),
+        (b'{"method": "list_reactions", "params": [1]}\n', "invalid request"),
+        (b"not json\n", "invalid request"),
+        ('{"method": "list_reactions", "token": "é"}\n'.encode(), "token_mismatch"),
+        (b'{"method": "list_reactions"}\n', "token_mismatch"),
+    ])
+    def test_malformed_request_keeps_daemon_running(self, running_daemon, request_line, error):
+        response = daemon.orjson.loads(_send_raw(running_daemon, request_line))
+
+        assert response["ok"] is False
+        assert error in response["error"]
+        assert daemon.call("list_reactions", {}, "tok", running_daemon)["truncated"] is True
+
+    def test_client_disconnect_keeps_daemon_running(self, running_daemon):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(running_daemon))
+        client.close()
+
+        assert daemon.call("list_reactions", {}, "tok", running_daemon)["truncated"] is True
+
+
+class TestDaemonFallback:
+    """デーモンを利用できない場合のフォールバック"""
+
+    def test_missing_socket(self, fake_slack, tmp_path):
+        service = daemon.DaemonSlackService("tok", tmp_path / "todo.sock")
+
+        assert service.list_reactions() == ([ITEM], True)
+        assert _executed_by(service, fake_slack) == [("local", "tok", "list_reactions")]
+
+    def test_stale_socket(self, fake_slack, tmp_path):
+        # 異常終了したデーモンのソケット（待ち受けていない）
+        socket_path = tmp_path / "todo.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        service = daemon.DaemonSlackService("tok", socket_path)
+        assert service.list_reactions() == ([ITEM], True)
+        assert service.remove_reaction("eyes", "C1", "1.5") is True
+        assert _executed_by(service, fake_slack) == [
+            ("local", "tok", "list_reactions"),
+            ("local", "tok", "remove_reaction"),
+        ]
+
+    def test_connection_lost_after_request(self, fake_slack, tmp_path):
+        # 応答せずに接続を閉じるデーモン
+        socket_path = tmp_path / "todo.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen()
+
+        def close_without_reply():
+            while True:
+                conn, _ = server.accept()
+                conn.recv(65536)
+                conn.close()
+
+        threading.Thread(target=close_without_reply, daemon=True).start()
+        service = daemon.DaemonSlackService("tok", socket_path)
+
+        # list_reactions は冪等なためプロセス内で再実行する
+        assert service.list_reactions() == ([ITEM], True)
+        # remove_reaction はデーモン側で実行済みの可能性があるため再実行しない
+        with pytest.raises(SlackAPIError, match="Lost connection"):
+            service.remove_reaction("eyes", "C1", "1.5")
+        assert _executed_by(service, fake_slack) == [("local", "tok", "list_reactions")]
+        server.close()
+
+    def test_serve_replaces_stale_socket(self, fake_slack, tmp_path):
+        socket_path = tmp_path / "todo.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        threading.Thread(target=daemon.serve, args=("tok", socket_path), daemon=True).start()
+        _wait_for(lambda: daemon.is_running(socket_path))
+
+        assert daemon.call("list_reactions", {}, "tok", socket_path)["truncated"] is True
+
+    def test_serve_refuses_when_already_running(self, running_daemon):
+        with pytest.raises(daemon.DaemonAlreadyRunningError):
+            daemon.serve("tok", running_daemon)
+        assert daemon.is_running(running_daemon)
+
+
+class TestDaemonCommand:
+    """todo daemon コマンドの起動・停止"""
+
+    @staticmethod
+    def _start(home):
+        env = dict(
+            os.environ,
+            HOME=str(home),
+            SLACK_TOKEN="tok",
+            PYTHONPATH=str(Path(__file__).resolve().parents[1]),
+        )
+        return subprocess.Popen(
+            [sys.executable, "-m", "todo_cli.main", "daemon"],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def test_sigterm_removes_only_own_socket(self, tmp_path):
+        socket_path = tmp_path / ".todo-cli" / "todo.sock"
+        first = self._start(tmp_path)
+        try:
+            _wait_for(lambda: daemon.is_running(socket_path), timeout=15)
+
+            # 起動中は2つ目のデーモンを起動しない
+            second = self._start(tmp_path)
+            assert second.wait(timeout=15) == 1
+            assert daemon.is_running(socket_path)
+
+            # 1つ目のソケットを退避し、別のデーモンを起動
+            socket_path.rename(tmp_path / "first.sock")
+            third = self._start(tmp_path)
+            try:
+                _wait_for(lambda: daemon.is_running(socket_path), timeout=15)
+
+                # 1つ目を停止しても、別のデーモンのソケットは削除されない
+                first.send_signal(signal.SIGTERM)
+                assert first.wait(timeout=15) == 0
+                assert daemon.is_running(socket_path)
+            finally:
+                third.send_signal(signal.SIGTERM)
+                assert third.wait(timeout=15) == 0
+            assert not socket_path.exists()
+        finally:
+            first.kill()
+            first.wait()
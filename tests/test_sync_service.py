@@ -0,0 +1,99 @@
+"""
+同期サービスのテスト
+"""
+import pytest
+
+from todo_cli.core.storage import ConfigStorage, TaskStorage
+from todo_cli.services.slack_service import SlackReactionItem
+from todo_cli.services.sync_service import SyncService, _decode_task_url, _encode_task_url
+
+
+def _item(n):
+    return SlackReactionItem(
+        message_url=f"https://example.slack.com/archives/C1/p{n}",
+        title=f"message {n}",
+        timestamp=float(n),
+        channel_id="C1",
+        message_ts=f"{n}.0",
+    )
+
+
+class FakeSlackService:
+    """list_reactions の結果を固定で返すSlackService"""
+
+    def __init__(self, items, truncated):
+        self.items = items
+        self.truncated = truncated
+
+    def list_reactions(self, emoji="eyes"):
+        return list(self.items), self.truncated
+
+
+@pytest.fixture
+def sync_service(tmp_path):
+    service = SyncService(TaskStorage(tmp_path / "tasks.json"))
+    service.config_storage = ConfigStorage(tmp_path / "config.json")
+    return service
+
+
+class TestTaskUrl:
+    """タスクURLへのメタデータ埋め込み"""
+
+    @pytest.mark.parametrize("emoji", ["eyes", "+1", "white check", "memo&x=1#y"])
+    def test_roundtrip(self, emoji):
+        url = _encode_task_url("https://example.slack.com/archives/C1/p1", "C1", "1.5", emoji)
+
+        assert _decode_task_url(url) == (
+            "https://example.slack.com/archives/C1/p1",
+            {"channel": "C1", "ts": "1.5", "emoji": emoji},
+        )
+
+    def test_encoded_format(self):
+        url = _encode_task_url("https://example.slack.com/archives/C1/p1", "C1", "1.5", "+1")
+
+        assert url == "https://example.slack.com/archives/C1/p1#channel=C1&ts=1.5&emoji=%2B1"
+
+    def test_decode_legacy_unescaped_plus(self):
+        # 旧形式は絵文字名をエンコードせずに保存している
+        url = "https://example.slack.com/archives/C1/p1#channel=C1&ts=1.5&emoji=+1"
+
+        assert _decode_task_url(url) == (
+            "https://example.slack.com/archives/C1/p1",
+            {"channel": "C1", "ts": "1.5", "emoji": "+1"},
+        )
+
+
+class TestPullFromSlack:
+    """Slackからの同期"""
+
+    def _add_synced_task(self, service, n):
+        item = _item(n)
+        url = _encode_task_url(item.message_url, item.channel_id, item.message_ts, "eyes")
+        return service.storage.add_task(title=item.title, url=url)
+
+    def test_deletes_tasks_removed_in_slack(self, sync_service):
+        self._add_synced_task(sync_service, 1)
+        sync_service.slack_service = FakeSlackService([_item(2)], truncated=False)
+
+        assert sync_service.pull_from_slack() == (1, 1, 0)
+        assert [task.title for task in sync_service.storage.load_all()] == ["message 2"]
+
+    def test_truncated_list_does_not_delete(self, sync_service):
+        # ページ数上限で打ち切られた場合、未取得のアイテムを削除済みと判定しない
+        self._add_synced_task(sync_service, 1)
+        sync_service.slack_service = FakeSlackService([_item(2)], truncated=True)
+
+        assert sync_service.pull_from_slack() == (1, 0, 0)
+        assert sorted(task.title for task in sync_service.storage.load_all()) == [
+            "message 1", "message 2"
+        ]
+
+    def test_truncated_flag_is_kept_with_cache(self, sync_service):
+        self._add_synced_task(sync_service, 1)
+        sync_service.slack_service = FakeSlackService([_item(2)], truncated=True)
+        sync_service.pull_from_slack()
+
+        # キャッシュを使用する2回目の同期でも削除しない
+        sync_service.slack_service.truncated = False
+        assert sync_service.pull_from_slack() == (0, 0, 0)
+        assert len(sync_service.storage.load_all()) == 2
@@ -22,6 +22,9 @@ class Task:
         status: ステータス（"pending" | "done"）
         created_at: 作成日時（ISO 8601形式）
     """
+    # Python 3.9対応のため dataclass(slots=True) ではなく手動で定義
+    __slots__ = ("id", "title", "url", "due", "status", "created_at")
+
     id: int
     title: str
     url: str
@@ -54,13 +57,27 @@ class Task:
         )
 
     def to_dict(self) -> dict:
-        """タスクを辞書形式に変換"""
-        return asdict(self)
+        """タスクを辞書形式に変換（asdictのdeepcopyを避けて直接構築）"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "url": self.url,
+            "due": self.due,
+            "status": self.status,
+            "created_at": self.created_at
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Task":
-        """辞書からタスクを生成"""
-        return cls(**data)
+        """辞書からタスクを生成（load_allで全件呼ばれるためキーワード展開を避ける）"""
+        return cls(
+            data["id"],
+            data["title"],
+            data["url"],
+            data["due"],
+            data["status"],
+            data["created_at"]
+        )
 
     def mark_done(self) -> None:
         """タスクを完了状態にする"""
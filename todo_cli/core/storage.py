@@ -2,10 +2,12 @@
 ストレージ管理
 Phase 1: MVP - ローカルタスク管理用のJSON読み書き、ID採番、ソート
 """
-import json
 import os
+import tempfile
+import orjson
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from todo_cli.core.models import Task, Config
 
 # データディレクトリのパス
@@ -13,6 +15,65 @@ DATA_DIR = Path.home() / ".todo-cli"
 TASKS_FILE = DATA_DIR / "tasks.json"
 CONFIG_FILE = DATA_DIR / "config.json"
 
+# ソートキー
+_DUE_KEY = attrgetter("due", "created_at")
+_CREATED_KEY = attrgetter("created_at")
+_ID_KEY = attrgetter("id")
+_STATUS_KEY = attrgetter("status")
+
+
+# プロセスのumaskのキャッシュ（取得には設定し直しが必要なため1回だけ行う）
+_umask_cache: Optional[int] = None
+
+
+def _get_umask() -> int:
+    """
+    プロセスのumaskを取得（プロセス内でメモ化）
+
+    Returns:
+        int: umask
+    """
+    global _umask_cache
+    if _umask_cache is None:
+        _umask_cache = os.umask(0)
+        os.umask(_umask_cache)
+    return _umask_cache
+
+
+def _atomic_write(path: Path, data: bytes, mode: int = 0o666) -> None:
+    """
+    一時ファイルに書き込んでからリネームすることでアトミックに保存
+
+    書き込み途中でクラッシュしても元のファイルは壊れない。
+    データディレクトリは初回書き込み時に作成する
+
+    Args:
+        path: 保存先のパス
+        data: 書き込むバイト列
+        mode: 保存するファイルのパーミッション（open() と同様にumaskを適用する）
+    """
+    # 一時ファイル名はプロセスごとに一意にする（同時実行時に他プロセスの書き込み途中のファイルを置き換えない）
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    except FileNotFoundError:
+        # データディレクトリが存在しない場合は作成
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstempは0600で作成するため、umaskを適用したパーミッションを設定
+            os.fchmod(f.fileno(), mode & ~_get_umask())
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class TaskStorage:
     """タスクストレージ管理クラス"""
@@ -25,13 +86,11 @@ class TaskStorage:
             tasks_file: タスクファイルのパス（テスト用にオーバーライド可能）
         """
         self.tasks_file = tasks_file
-        self._ensure_data_dir()
-
-    def _ensure_data_dir(self) -> None:
-        """データディレクトリが存在しない場合は作成"""
-        self.tasks_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.tasks_file.exists():
-            self._save_tasks([])
+        # 1回のCLI実行中に何度もJSONを読み直さないためのキャッシュ（書き込み時に更新）
+        self._cache: Optional[List[Task]] = None
+        # タスクID → キャッシュ内インデックス（キャッシュ更新時に再構築）
+        self._id_index: Optional[Dict[int, int]] = None
+        # ファイル・ディレクトリは初回の書き込み時に作成する（読み込みのみの実行ではstatしない）
 
     def _save_tasks(self, tasks: List[Task]) -> None:
         """
@@ -40,23 +99,49 @@ class TaskStorage:
         Args:
             tasks: 保存するタスクのリスト
         """
-        task_dicts = [task.to_dict() for task in tasks]
-        with open(self.tasks_file, "w", encoding="utf-8") as f:
-            json.dump(task_dicts, f, ensure_ascii=False, indent=2)
+        # orjsonはdataclassを直接シリアライズできるため、to_dict()での辞書構築は不要
+        _atomic_write(self.tasks_file, orjson.dumps(tasks, option=orjson.OPT_INDENT_2))
+        self._cache = tasks
+        self._id_index = None
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄し、次回の読み込み時にファイルから再読込する"""
+        self._cache = None
+        self._id_index = None
+
+    def _index_of(self, task_id: int) -> Optional[int]:
+        """
+        キャッシュ内でのタスクの位置を取得
+
+        Args:
+            task_id: タスクID
+
+        Returns:
+            Optional[int]: インデックス、存在しない場合はNone
+        """
+        if self._cache is None:
+            self.load_all()
+        if self._id_index is None:
+            self._id_index = {t.id: i for i, t in enumerate(self._cache)}
+        return self._id_index.get(task_id)
 
     def load_all(self) -> List[Task]:
         """
-        すべてのタスクを読み込む
+        すべてのタスクを読み込む（2回目以降はキャッシュを使用）
+
+        ソートはファイルから読み込んだ時点で1回だけ行う（書き込み時はソートしない）
 
         Returns:
-            List[Task]: タスクのリスト
+            List[Task]: タスクのリスト（期日順）
         """
-        try:
-            with open(self.tasks_file, "r", encoding="utf-8") as f:
-                task_dicts = json.load(f)
-                return [Task.from_dict(d) for d in task_dicts]
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        if self._cache is None:
+            try:
+                task_dicts = orjson.loads(self.tasks_file.read_bytes())
+                self._cache = self._sort_tasks([Task.from_dict(d) for d in task_dicts])
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                self._cache = []
+        # 呼び出し側でのappend等がキャッシュに波及しないようリストはコピーして返す
+        return list(self._cache)
 
     def load_pending(self) -> List[Task]:
         """
@@ -68,6 +153,23 @@ class TaskStorage:
         all_tasks = self.load_all()
         return [task for task in all_tasks if task.is_pending()]
 
+    def count_pending(self) -> int:
+        """
+        未完了タスクの件数を取得（ステータスバー用）
+
+        Taskオブジェクトを生成せず、JSONのstatusフィールドを直接数える
+
+        Returns:
+            int: 未完了タスクの件数
+        """
+        if self._cache is not None:
+            return list(map(_STATUS_KEY, self._cache)).count("pending")
+        try:
+            task_dicts = orjson.loads(self.tasks_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return 0
+        return sum(1 for d in task_dicts if d.get("status") == "pending")
+
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
         指定したIDのタスクを取得
@@ -78,11 +180,8 @@ class TaskStorage:
         Returns:
             Optional[Task]: タスク、存在しない場合はNone
         """
-        tasks = self.load_all()
-        for task in tasks:
-            if task.id == task_id:
-                return task
-        return None
+        i = self._index_of(task_id)
+        return self._cache[i] if i is not None else None
 
     def add_task(self, title: str, due: Optional[str] = None, url: str = "") -> Task:
         """
@@ -100,8 +199,7 @@ class TaskStorage:
         new_id = self._get_next_id(tasks)
         new_task = Task.create(id=new_id, title=title, due=due, url=url)
         tasks.append(new_task)
-        sorted_tasks = self._sort_tasks(tasks)
-        self._save_tasks(sorted_tasks)
+        self._save_tasks(tasks)
         return new_task
 
     def update_task(self, task: Task) -> None:
@@ -112,12 +210,10 @@ class TaskStorage:
             task: 更新するタスク
         """
         tasks = self.load_all()
-        for i, t in enumerate(tasks):
-            if t.id == task.id:
-                tasks[i] = task
-                break
-        sorted_tasks = self._sort_tasks(tasks)
-        self._save_tasks(sorted_tasks)
+        i = self._index_of(task.id)
+        if i is not None:
+            tasks[i] = task
+        self._save_tasks(tasks)
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -130,16 +226,14 @@ class TaskStorage:
             bool: 削除成功時True
         """
         tasks = self.load_all()
-        original_count = len(tasks)
-        tasks = [task for task in tasks if task.id != task_id]
-
-        if len(tasks) == original_count:
+        i = self._index_of(task_id)
+        if i is None:
             return False  # タスクが見つからなかった
+        del tasks[i]
 
         # ID再採番（欠番なし）
         renumbered_tasks = self._renumber_tasks(tasks)
-        sorted_tasks = self._sort_tasks(renumbered_tasks)
-        self._save_tasks(sorted_tasks)
+        self._save_tasks(renumbered_tasks)
         return True
 
     def mark_done(self, task_id: int) -> bool:
@@ -152,11 +246,12 @@ class TaskStorage:
         Returns:
             bool: 完了成功時True
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
+        tasks = self.load_all()
+        i = self._index_of(task_id)
+        if i is None:
             return False
-        task.mark_done()
-        self.update_task(task)
+        tasks[i].mark_done()
+        self._save_tasks(tasks)
         return True
 
     def _get_next_id(self, tasks: List[Task]) -> int:
@@ -169,9 +264,7 @@ class TaskStorage:
         Returns:
             int: 次のID（1から始まる連番）
         """
-        if not tasks:
-            return 1
-        return max(task.id for task in tasks) + 1
+        return max((task.id for task in tasks), default=0) + 1
 
     def _renumber_tasks(self, tasks: List[Task]) -> List[Task]:
         """
@@ -204,14 +297,16 @@ class TaskStorage:
         """
         if sort_by == "due":
             # 期日順（期日なしは最後）
-            return sorted(
-                tasks,
-                key=lambda t: (t.due is None, t.due or "", t.created_at)
-            )
+            # 期日あり/なしに分けてからソートし、キーはCレベルのattrgetterで取得する
+            with_due = [t for t in tasks if t.due is not None]
+            without_due = [t for t in tasks if t.due is None]
+            with_due.sort(key=_DUE_KEY)
+            without_due.sort(key=_CREATED_KEY)
+            return with_due + without_due
         elif sort_by == "created":
-            return sorted(tasks, key=lambda t: t.created_at)
+            return sorted(tasks, key=_CREATED_KEY)
         else:  # "id"
-            return sorted(tasks, key=lambda t: t.id)
+            return sorted(tasks, key=_ID_KEY)
 
 
 class ConfigStorage:
@@ -225,11 +320,6 @@ class ConfigStorage:
             config_file: 設定ファイルのパス
         """
         self.config_file = config_file
-        self._ensure_data_dir()
-
-    def _ensure_data_dir(self) -> None:
-        """データディレクトリが存在しない場合は作成"""
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
     def load(self) -> Config:
         """
@@ -239,16 +329,15 @@ class ConfigStorage:
             Config: 設定オブジェクト
         """
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                config_dict = json.load(f)
-                # 既知のフィールドのみ抽出（後方互換性対応）
-                known_fields = {
-                    "slack_token": config_dict.get("slack_token", ""),
-                    "reaction_emoji": config_dict.get("reaction_emoji", "eyes"),
-                    "default_sort": config_dict.get("default_sort", "due")
-                }
-                return Config.from_dict(known_fields)
-        except (FileNotFoundError, json.JSONDecodeError):
+            config_dict = orjson.loads(self.config_file.read_bytes())
+            # 既知のフィールドのみ抽出（後方互換性対応）
+            known_fields = {
+                "slack_token": config_dict.get("slack_token", ""),
+                "reaction_emoji": config_dict.get("reaction_emoji", "eyes"),
+                "default_sort": config_dict.get("default_sort", "due")
+            }
+            return Config.from_dict(known_fields)
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return Config()
 
     def save(self, config: Config) -> None:
@@ -258,8 +347,39 @@ class ConfigStorage:
         Args:
             config: 保存する設定オブジェクト
         """
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config.to_dict(), f, ensure_ascii=False, indent=2)
-
-        # セキュリティ: ファイルパーミッションを600に設定
-        os.chmod(self.config_file, 0o600)
+        _atomic_write(
+            self.config_file,
+            orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2),
+            mode=0o600  # セキュリティ: ファイルパーミッションを600に設定
+        )
+
+
+# デフォルトのストレージインスタンス（初回アクセス時に生成し、全コマンド・サービスで共有）
+_default_storage: Optional[TaskStorage] = None
+_default_config_storage: Optional[ConfigStorage] = None
+
+
+def get_default_storage() -> TaskStorage:
+    """
+    デフォルトのタスクストレージを取得
+
+    Returns:
+        TaskStorage: プロセス内で共有されるタスクストレージ
+    """
+    global _default_storage
+    if _default_storage is None:
+        _default_storage = TaskStorage()
+    return _default_storage
+
+
+def get_default_config_storage() -> ConfigStorage:
+    """
+    デフォルトの設定ストレージを取得
+
+    Returns:
+        ConfigStorage: プロセス内で共有される設定ストレージ
+    """
+    global _default_config_storage
+    if _default_config_storage is None:
+        _default_config_storage = ConfigStorage()
+    return _default_config_storage
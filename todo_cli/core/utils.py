@@ -2,9 +2,30 @@
 ユーティリティ関数
 Phase 1: MVP - 日時変換、フォーマット処理など
 """
-from datetime import datetime
+import re
+from functools import lru_cache
+from datetime import date, datetime
 from typing import Optional
 
+# "2025-11-10" / "11/10" / "11-10" 形式の日付パターン（年は省略可）
+_DATE_RE = re.compile(r"^(?:(\d{4})-)?(\d{1,2})[-/](\d{1,2})$")
+
+# 現在の年のキャッシュ（CLIのプロセスは短命なため1回だけ取得すれば十分）
+_current_year_cache: Optional[int] = None
+
+
+def _current_year() -> int:
+    """
+    現在の年を取得（プロセス内でメモ化）
+
+    Returns:
+        int: 現在の年
+    """
+    global _current_year_cache
+    if _current_year_cache is None:
+        _current_year_cache = datetime.now().year
+    return _current_year_cache
+
 
 def format_date(date_str: Optional[str]) -> str:
     """
@@ -16,13 +37,27 @@ def format_date(date_str: Optional[str]) -> str:
     Returns:
         str: フォーマットされた日付（例: "11/10"）、Noneの場合は "-"
     """
-    if not date_str:
+    # 手動編集で文字列以外（リストなど）が入っている場合はキャッシュのキーにできない
+    if not date_str or not isinstance(date_str, str):
         return "-"
+    return _format_date_cached(date_str)
+
 
+@lru_cache(maxsize=256)
+def _format_date_cached(date_str: str) -> str:
+    """
+    format_date の本体（一覧表示では同じ期日のタスクが多いため、結果をキャッシュする）
+
+    Args:
+        date_str: ISO 8601形式の日付文字列
+
+    Returns:
+        str: フォーマットされた日付、パース失敗時は "-"
+    """
     try:
         dt = datetime.fromisoformat(date_str)
         return dt.strftime("%m/%d")
-    except (ValueError, TypeError):
+    except ValueError:
         return "-"
 
 
@@ -44,27 +79,24 @@ def parse_date(date_input: str) -> Optional[str]:
     if not date_input:
         return None
 
-    # ISO 8601形式の場合はそのまま返す
+    match = _DATE_RE.match(date_input.strip())
+    if match:
+        year, month, day = match.groups()
+        try:
+            return date(
+                int(year) if year else _current_year(),
+                int(month),
+                int(day)
+            ).isoformat()
+        except ValueError:
+            return None  # 存在しない日付（例: 2/30）
+
+    # その他のISO 8601形式（日時付きなど）はそのまま返す
     try:
         datetime.fromisoformat(date_input)
         return date_input
     except ValueError:
-        pass
-
-    # "月/日" または "月-日" 形式を試す
-    current_year = datetime.now().year
-    for separator in ["/", "-"]:
-        if separator in date_input:
-            try:
-                parts = date_input.split(separator)
-                if len(parts) == 2:
-                    month, day = int(parts[0]), int(parts[1])
-                    dt = datetime(current_year, month, day)
-                    return dt.date().isoformat()
-            except (ValueError, IndexError):
-                pass
-
-    return None
+        return None
 
 
 def format_datetime(dt_str: str) -> str:
@@ -4,13 +4,14 @@ Phase 2: Slack連携Todo管理CLI
 """
 import typer
 import os
-from typing import Optional
-from todo_cli.core.storage import TaskStorage, ConfigStorage
+import signal
+import sys
+from functools import lru_cache
+from typing import List, Optional
+from todo_cli.core.storage import get_default_storage, get_default_config_storage
 from todo_cli.core.utils import parse_date, validate_task_id
 from todo_cli.views.list_view import render_task_list, render_task_list_with_status
 from todo_cli.views.summary_view import render_summary
-from todo_cli.services.sync_service import SyncService
-from todo_cli.services.slack_service import SlackAPIError
 
 app = typer.Typer(
     name="todo",
@@ -18,13 +19,59 @@ app = typer.Typer(
     add_completion=False
 )
 
-# ストレージインスタンス
-storage = TaskStorage()
-config_storage = ConfigStorage()
-sync_service = SyncService(storage)
+
+@app.callback()
+def _root() -> None:
+    # コマンドを1つだけ登録した場合も、サブコマンド形式（todo <command>）で動作させるため
+    pass
+
+
+def _get_sync_service():
+    """
+    同期サービスを取得
+
+    summary などSlack連携が不要なコマンドの起動を速くするため、
+    services パッケージは初回呼び出し時にimportする
+
+    Returns:
+        SyncService: 同期サービスインスタンス
+    """
+    from todo_cli.services.sync_service import get_default_sync_service
+    return get_default_sync_service()
+
+
+@lru_cache(maxsize=1)
+def _is_slack_configured() -> bool:
+    """
+    Slack連携が設定済みかチェック（servicesをimportせずに判定、結果はプロセス内でキャッシュ）
+
+    Returns:
+        bool: 設定済みならTrue
+    """
+    return bool(os.getenv("SLACK_TOKEN"))
+
+
+def _remove_slack_reaction(task_url: str) -> None:
+    """
+    タスクに対応するSlackリアクションを削除（done / delete 共通）
+
+    Slack連携が未設定、またはSlack由来でないタスクの場合は何もしない。
+    失敗してもローカルの処理は継続するため、警告表示のみ行う
+
+    Args:
+        task_url: タスクのURL（メタデータ埋め込み済み）
+    """
+    if not (_is_slack_configured() and task_url):
+        return
+
+    from todo_cli.services.slack_service import SlackAPIError
+    try:
+        if _get_sync_service().push_to_slack(task_url):
+            typer.echo("Slackリアクションを削除しました")
+    except (ValueError, SlackAPIError) as e:
+        typer.echo(f"警告: Slackリアクション削除失敗: {e}", err=True)
 
 
-@app.command()
 def add(
     title: str = typer.Argument(..., help="タスクのタイトル"),
     due: Optional[str] = typer.Option(None, "--due", "-d", help="期日 (例: 11/10 または 2025-11-10)")
@@ -43,14 +90,13 @@ def add(
 
     # タスク追加
     try:
-        task = storage.add_task(title=title, due=due_date)
+        task = get_default_storage().add_task(title=title, due=due_date)
         typer.echo(f"✓ タスクを追加しました (ID: {task.id})")
     except Exception as e:
         typer.echo(f"エラー: タスクの追加に失敗しました: {e}", err=True)
         raise typer.Exit(code=1)
 
 
-@app.command("list")
 def list_tasks(
     all: bool = typer.Option(False, "--all", "-a", help="完了タスクも含めて表示"),
     no_sync: bool = typer.Option(False, "--no-sync", help="Slack同期をスキップ")
@@ -58,9 +104,12 @@ def list_tasks(
     """
     タスク一覧を表示（Slack連携時は自動同期）
     """
+    storage = get_default_storage()
     try:
         # Slack同期（設定済みの場合のみ）
-        if not no_sync and sync_service.is_slack_configured():
+        if not no_sync and _is_slack_configured():
+            from todo_cli.services.slack_service import SlackAPIError
+            sync_service = _get_sync_service()
             try:
                 added, deleted, errors = sync_service.pull_from_slack()
                 if added > 0 or deleted > 0:
@@ -80,12 +129,11 @@ def list_tasks(
         raise typer.Exit(code=1)
 
 
-@app.command()
 def done(
     task_id: str = typer.Argument(..., help="完了するタスクのID")
 ):
     """
-    タスクを完了状態にする（Slack連携時はブックマークも削除）
+    タスクを完了状態にする（Slack連携時はリアクションも削除）
     """
     # IDの検証
     id_int = validate_task_id(task_id)
@@ -94,18 +142,14 @@ def done(
         raise typer.Exit(code=1)
 
     # タスク情報を取得
+    storage = get_default_storage()
     task = storage.get_task_by_id(id_int)
     if not task:
         typer.echo(f"エラー: タスク #{id_int} が見つかりません", err=True)
         raise typer.Exit(code=1)
 
     # Slackリアクション削除（設定済みの場合のみ）
-    if sync_service.is_slack_configured() and task.url:
-        try:
-            if sync_service.push_to_slack(task.url):
-                typer.echo("Slackリアクションを削除しました")
-        except (ValueError, SlackAPIError) as e:
-            typer.echo(f"警告: Slackリアクション削除失敗: {e}", err=True)
+    _remove_slack_reaction(task.url)
 
     # タスクを完了
     try:
@@ -120,13 +164,12 @@ def done(
         raise typer.Exit(code=1)
 
 
-@app.command()
 def delete(
     task_id: str = typer.Argument(..., help="削除するタスクのID"),
     force: bool = typer.Option(False, "--force", "-f", help="確認なしで削除")
 ):
     """
-    タスクを完全削除（Slack連携時はブックマークも削除）
+    タスクを完全削除（Slack連携時はリアクションも削除）
     """
     # IDの検証
     id_int = validate_task_id(task_id)
@@ -135,6 +178,7 @@ def delete(
         raise typer.Exit(code=1)
 
     # タスクの存在確認
+    storage = get_default_storage()
     task = storage.get_task_by_id(id_int)
     if not task:
         typer.echo(f"エラー: タスク #{id_int} が見つかりません", err=True)
@@ -149,12 +193,7 @@ def delete(
             raise typer.Exit(code=0)
 
     # Slackリアクション削除（設定済みの場合のみ）
-    if sync_service.is_slack_configured() and task.url:
-        try:
-            if sync_service.push_to_slack(task.url):
-                typer.echo("Slackリアクションを削除しました")
-        except (ValueError, SlackAPIError) as e:
-            typer.echo(f"警告: Slackリアクション削除失敗: {e}", err=True)
+    _remove_slack_reaction(task.url)
 
     # タスクを削除
     try:
@@ -169,20 +208,17 @@ def delete(
         raise typer.Exit(code=1)
 
 
-@app.command()
 def summary():
     """
     未完了タスク件数を表示（ステータスバー用）
     """
     try:
-        tasks = storage.load_all()
-        render_summary(tasks)
+        render_summary(get_default_storage().count_pending())
     except Exception as e:
         typer.echo("Todo: -", err=True)
         raise typer.Exit(code=1)
 
 
-@app.command()
 def setup(
     emoji: Optional[str] = typer.Option(None, "--emoji", "-e", help="使用する絵文字名（デフォルト: eyes）")
 ):
@@ -209,6 +245,8 @@ def setup(
         typer.echo("  4. Install App to Workspace → User OAuth Token をコピー")
         raise typer.Exit(code=1)
 
+    config_storage = get_default_config_storage()
+
     # 絵文字設定
     if emoji:
         config = config_storage.load()
@@ -218,7 +256,7 @@ def setup(
 
     # 接続テスト
     typer.echo("Slack接続テスト中...")
-    success, message = sync_service.test_slack_connection()
+    success, message = _get_sync_service().test_slack_connection()
     if not success:
         typer.echo(f"エラー: {message}", err=True)
         raise typer.Exit(code=1)
@@ -232,7 +270,36 @@ def setup(
     typer.echo("  3. 'todo done <id>' で完了 → Slackのリアクションも自動削除")
 
 
-@app.command()
+def daemon():
+    """
+    Slack APIデーモンを起動（接続を保持して同期を高速化）
+    """
+    token = os.getenv("SLACK_TOKEN")
+    if not token:
+        typer.echo("エラー: SLACK_TOKEN環境変数が設定されていません", err=True)
+        raise typer.Exit(code=1)
+
+    from todo_cli.services.daemon import SOCKET_PATH, DaemonAlreadyRunningError, is_running, serve
+
+    if is_running():
+        typer.echo(f"エラー: デーモンは既に起動しています: {SOCKET_PATH}", err=True)
+        raise typer.Exit(code=1)
+
+    # バックグラウンド実行（todo daemon &）の停止に使われるSIGTERMでも、
+    # Ctrl+C と同様にソケットを削除して終了する
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    typer.echo(f"✓ Slack APIデーモンを起動しました: {SOCKET_PATH}")
+    typer.echo("  停止するには Ctrl+C を押してください")
+    try:
+        serve(token)
+    except DaemonAlreadyRunningError:
+        typer.echo(f"エラー: デーモンは既に起動しています: {SOCKET_PATH}", err=True)
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        typer.echo("\nデーモンを停止しました")
+
+
 def version():
     """
     バージョン情報を表示
@@ -241,5 +308,43 @@ def version():
     typer.echo("Slackリアクション（👀）との双方向同期対応")
 
 
-if __name__ == "__main__":
+# コマンド名 → ハンドラ
+_COMMANDS = {
+    "add": add,
+    "list": list_tasks,
+    "done": done,
+    "delete": delete,
+    "summary": summary,
+    "setup": setup,
+    "daemon": daemon,
+    "version": version,
+}
+
+
+def _register_commands(argv: Optional[List[str]] = None) -> None:
+    """
+    コマンドをTyperアプリに登録
+
+    Typerは実行時に登録済みの全コマンドのシグネチャを解析するため、
+    実行するコマンドが分かる場合はそのコマンドのみ登録する。
+    コマンド名が不明な場合（--help など）は全コマンドを登録する
+
+    Args:
+        argv: コマンドライン引数（Noneの場合は全コマンドを登録）
+    """
+    name = argv[1] if argv and len(argv) > 1 else None
+    if name in _COMMANDS:
+        app.command(name)(_COMMANDS[name])
+        return
+    for command_name, handler in _COMMANDS.items():
+        app.command(command_name)(handler)
+
+
+def main() -> None:
+    """CLIエントリーポイント"""
+    _register_commands(sys.argv)
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""
+Slack API デーモン
+CLIの実行ごとに発生するTCP/TLSハンドシェイクを避けるため、
+SlackService（共有HTTPセッション）を常駐プロセスで保持し、Unixソケット経由で呼び出す
+"""
+import hashlib
+import hmac
+import os
+import socket
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from todo_cli.core.storage import DATA_DIR
+from todo_cli.services.slack_service import SlackService, SlackReactionItem, SlackAPIError
+
+# デーモンのソケットパス
+SOCKET_PATH = DATA_DIR / "todo.sock"
+
+# クライアント側のタイムアウト（秒）: Slack APIのリトライ待ちを含めて十分な長さ
+CLIENT_TIMEOUT = 60
+
+# デーモン側の送受信タイムアウト（秒）: 改行を送らないクライアントで処理が止まらないようにする
+CONNECTION_TIMEOUT = 5
+
+# デーモン経由で呼び出せるメソッド
+_ALLOWED_METHODS = {"list_reactions", "remove_reaction"}
+
+# クライアントとデーモンのトークンが一致しない場合のエラー
+_TOKEN_MISMATCH = "token_mismatch"
+
+
+class DaemonUnavailableError(Exception):
+    """デーモンに接続できない"""
+    pass
+
+
+class DaemonConnectionLostError(DaemonUnavailableError):
+    """リクエスト送信後にデーモンとの通信が失敗した（デーモン側で実行済みの可能性がある）"""
+    pass
+
+
+class DaemonAlreadyRunningError(Exception):
+    """既にデーモンが起動している"""
+    pass
+
+
+def _token_fingerprint(token: str) -> str:
+    """
+    トークンの識別用ハッシュを作成（トークン自体はソケットに流さない）
+
+    Args:
+        token: Slack OAuth Token
+
+    Returns:
+        str: トークンのハッシュ（16進数）
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _recv_line(conn: socket.socket) -> bytes:
+    """
+    改行までのデータを受信
+
+    Args:
+        conn: 接続済みソケット
+
+    Returns:
+        bytes: 受信したデータ（改行を除く）
+    """
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        if b"\n" in chunk:
+            chunks.append(chunk[:chunk.index(b"\n")])
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _dispatch(slack: SlackService, fingerprint: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    リクエストを実行してレスポンスを作成
+
+    Args:
+        slack: Slackサービス
+        fingerprint: デーモンのトークンのハッシュ
+        request: {"method": ..., "params": {...}, "token": トークンのハッシュ}
+
+    Returns:
+        Dict[str, Any]: {"ok": True, "result": ...} または {"ok": False, "error": ...}
+    """
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "invalid request: expected an object"}
+    params = request.get("params", {})
+    if not isinstance(params, dict):
+        return {"ok": False, "error": "invalid request: params must be an object"}
+
+    # 別のトークン（別ワークスペース・別ユーザー）のリクエストは実行しない
+    # compare_digest は非ASCIIの str を受け付けないため、bytesで比較する
+    token = request.get("token")
+    if not isinstance(token, str) or not hmac.compare_digest(
+        token.encode("utf-8", "surrogatepass"), fingerprint.encode()
+    ):
+        return {"ok": False, "error": _TOKEN_MISMATCH}
+
+    method = request.get("method")
+    if method not in _ALLOWED_METHODS:
+        return {"ok": False, "error": f"unknown method: {method}"}
+
+    try:
+        result = getattr(slack, method)(**params)
+    except SlackAPIError as e:
+        return {"ok": False, "error": str(e)}
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    if method == "list_reactions":
+        items, truncated = result
+        result = {"items": [asdict(item) for item in items], "truncated": truncated}
+    return {"ok": True, "result": result}
+
+
+def _handle_request(slack: SlackService, fingerprint: str, line: bytes) -> bytes:
+    """
+    受信した1行のリクエストを処理してレスポンスを作成
+
+    不正なリクエストや予期しない例外もエラーレスポンスとして返す
+    （1つのクライアントの異常でデーモンを停止させない）
+
+    Args:
+        slack: Slackサービス
+        fingerprint: デーモンのトークンのハッシュ
+        line: 受信したリクエスト
+
+    Returns:
+        bytes: 送信するレスポンス（改行付き）
+    """
+    try:
+        response = _dispatch(slack, fingerprint, orjson.loads(line))
+        return orjson.dumps(response) + b"\n"
+    except orjson.JSONDecodeError as e:
+        response = {"ok": False, "error": f"invalid request: {e}"}
+    except Exception as e:
+        response = {"ok": False, "error": f"internal error: {type(e).__name__}"}
+    return orjson.dumps(response) + b"\n"
+
+
+def is_running(socket_path: Path = SOCKET_PATH) -> bool:
+    """
+    デーモンが起動しているか（ソケットに接続できるか）をチェック
+
+    Args:
+        socket_path: ソケットのパス
+
+    Returns:
+        bool: 接続できればTrue
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CONNECTION_TIMEOUT)
+    with client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _socket_id(socket_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    ソケットファイルの識別子を取得
+
+    Args:
+        socket_path: ソケットのパス
+
+    Returns:
+        Optional[Tuple[int, int]]: (デバイス, inode)、存在しない場合はNone
+    """
+    try:
+        st = socket_path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def serve(token: str, socket_path: Path = SOCKET_PATH) -> None:
+    """
+    デーモンを起動（フォアグラウンドで実行し続ける）
+
+    Args:
+        token: Slack OAuth Token
+        socket_path: ソケットのパス
+
+    Raises:
+        DaemonAlreadyRunningError: 既にデーモンが起動している場合
+    """
+    # 同じインスタンスで繰り返し取得するため、reactions.list のページキャッシュを有効にする
+    slack = SlackService(token, cache_pages=True)
+    fingerprint = _token_fingerprint(token)
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        if is_running(socket_path):
+            raise DaemonAlreadyRunningError(f"daemon is already running: {socket_path}")
+        # 異常終了したデーモンのソケットが残っている場合は削除
+        socket_path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # セキュリティ: ソケットは本人のみアクセス可能にする
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    own_socket = _socket_id(socket_path)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # 切断・タイムアウトしたクライアントは破棄して次の接続を待つ
+                try:
+                    conn.settimeout(CONNECTION_TIMEOUT)
+                    conn.sendall(_handle_request(slack, fingerprint, _recv_line(conn)))
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        # 別のデーモンが作成したソケットは削除しない
+        if _socket_id(socket_path) == own_socket:
+            socket_path.unlink(missing_ok=True)
+
+
+def call(
+    method: str,
+    params: Dict[str, Any],
+    token: str,
+    socket_path: Path = SOCKET_PATH
+) -> Any:
+    """
+    デーモンのメソッドを呼び出す
+
+    Args:
+        method: メソッド名
+        params: 引数
+        token: Slack OAuth Token（デーモンのトークンと一致する場合のみ実行される）
+        socket_path: ソケットのパス
+
+    Returns:
+        Any: 実行結果
+
+    Raises:
+        DaemonUnavailableError: デーモンに接続できない、またはトークンが一致しない場合
+        DaemonConnectionLostError: リクエスト送信後にデーモンとの通信が失敗した場合
+        SlackAPIError: デーモン側でエラーが発生した場合
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(CLIENT_TIMEOUT)
+    with client:
+        try:
+            client.connect(str(socket_path))
+        except OSError as e:
+            raise DaemonUnavailableError(str(e))
+        request = {"method": method, "params": params, "token": _token_fingerprint(token)}
+        try:
+            client.sendall(orjson.dumps(request) + b"\n")
+            line = _recv_line(client)
+        except OSError as e:
+            # タイムアウト・接続リセット
+            raise DaemonConnectionLostError(str(e))
+
+    # デーモンが応答前に終了した場合は空、または途中までのデータになる
+    if not line:
+        raise DaemonConnectionLostError("daemon closed the connection without a response")
+    try:
+        response = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        raise DaemonConnectionLostError(f"invalid response: {e}")
+
+    if not response.get("ok"):
+        if response.get("error") == _TOKEN_MISMATCH:
+            raise DaemonUnavailableError("daemon is running with a different SLACK_TOKEN")
+        raise SlackAPIError(response.get("error", "unknown_error"))
+    return response.get("result")
+
+
+class DaemonSlackService:
+    """
+    デーモン経由のSlackサービス
+
+    SlackServiceと同じインターフェースを持ち、デーモンが起動していない場合や
+    デーモンが別のトークンで起動している場合はプロセス内のSlackServiceで実行する
+    """
+
+    def __init__(self, token: str, socket_path: Path = SOCKET_PATH):
+        """
+        初期化
+
+        Args:
+            token: Slack OAuth Token
+            socket_path: ソケットのパス
+        """
+        self.token = token
+        self.socket_path = socket_path
+        self.local = SlackService(token)
+
+    def _call(self, method: str, params: Dict[str, Any], idempotent: bool) -> Optional[Any]:
+        """
+        デーモンを呼び出す（接続できない・トークンが一致しない場合はNone）
+
+        Args:
+            method: メソッド名
+            params: 引数
+            idempotent: 再実行しても結果が変わらないか
+                （Trueの場合、送信後に通信が失敗してもプロセス内で再実行する）
+
+        Returns:
+            Optional[Any]: 実行結果、デーモンを利用できない場合はNone
+
+        Raises:
+            SlackAPIError: 再実行できないメソッドの送信後に通信が失敗した場合
+        """
+        try:
+            return call(method, params, self.token, self.socket_path)
+        except DaemonConnectionLostError as e:
+            # デーモン側で実行済みの可能性があるため、冪等なメソッドのみ再実行する
+            if not idempotent:
+                raise SlackAPIError(f"Lost connection to the daemon: {e}")
+            return None
+        except DaemonUnavailableError:
+            return None
+
+    def list_reactions(
+        self,
+        emoji: str = "eyes",
+        **kwargs: Any
+    ) -> Tuple[List[SlackReactionItem], bool]:
+        """
+        特定の絵文字リアクションを付けたアイテムを取得
+
+        Args:
+            emoji: 絵文字名
+            **kwargs: SlackService.list_reactions に渡す引数
+
+        Returns:
+            Tuple[List[SlackReactionItem], bool]: (リアクション付きアイテムのリスト, 途中で打ち切ったか)
+        """
+        result = self._call("list_reactions", {"emoji": emoji, **kwargs}, idempotent=True)
+        if result is None:
+            return self.local.list_reactions(emoji=emoji, **kwargs)
+        return [SlackReactionItem(**item) for item in result["items"]], result["truncated"]
+
+    def remove_reaction(self, emoji: str, channel: str, timestamp: str) -> bool:
+        """
+        リアクションを削除
+
+        Args:
+            emoji: 絵文字名
+            channel: チャンネルID
+            timestamp: メッセージタイムスタンプ
+
+        Returns:
+            bool: 削除成功時True
+        """
+        params = {"emoji": emoji, "channel": channel, "timestamp": timestamp}
+        result = self._call("remove_reaction", params, idempotent=False)
+        if result is None:
+            return self.local.remove_reaction(**params)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        # test_connection などデーモン非対応のメソッドはプロセス内で実行
+        return getattr(self.local, name)
@@ -3,15 +3,61 @@ Slack API サービス
 Phase 2（改訂版）: Slack リアクション連携
 公式API使用: reactions.list
 """
+import hashlib
+import orjson
 import requests
-from typing import List, Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
-import time
+from operator import itemgetter
 
 
-@dataclass
+def _create_session() -> requests.Session:
+    """
+    接続プール・リトライ設定済みのHTTPセッションを作成
+
+    TCP/TLS接続を複数のSlackServiceインスタンス・API呼び出しで使い回す。
+    リトライ（429/5xx、Retry-Afterヘッダー対応、ジッター付き指数バックオフ）はurllib3に任せる
+
+    Returns:
+        requests.Session: 共有セッション
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_max=10,  # 待機時間の上限（秒）
+        backoff_jitter=0.5,  # 同時実行時に再試行が揃わないようランダムな揺らぎを加える
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True  # 429時はSlackが返すRetry-Afterの秒数だけ待機
+    )
+    # 接続先は slack.com のみで、リクエストは逐次実行のため小さなプールで十分
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json; charset=utf-8"})
+    return session
+
+
+# モジュール共有のHTTPセッション（トークンはリクエストごとにヘッダーで指定）
+_SESSION = _create_session()
+
+# reactions.list のメッセージから取り出すフィールド
+_MESSAGE_FIELDS = itemgetter("text", "ts")
+
+# パーマリンクのテンプレートと、タイムスタンプから "." を除去する変換テーブル
+_PERMALINK_TMPL = "https://slack.com/archives/{cid}/p{ts}".format_map
+_NO_DOT = str.maketrans("", "", ".")
+
+
+@dataclass(frozen=True)
 class SlackReactionItem:
     """Slackリアクション付きアイテムデータ"""
+    # Python 3.9対応のため dataclass(slots=True) ではなく手動で定義
+    __slots__ = ("message_url", "title", "timestamp", "channel_id", "message_ts")
+
     message_url: str      # メッセージのURL
     title: str            # メッセージテキスト
     timestamp: float      # Unix timestamp
@@ -19,6 +65,15 @@ class SlackReactionItem:
     message_ts: str       # メッセージタイムスタンプ
 
 
+@dataclass
+class _ReactionPage:
+    """reactions.list の1ページ分の取得結果（変化検出用のキャッシュ）"""
+    etag: Optional[str]             # レスポンスのETag
+    digest: bytes                   # レスポンス本文のハッシュ
+    items: List[SlackReactionItem]  # パース済みのアイテム
+    next_cursor: str                # 次ページのカーソル
+
+
 class SlackAPIError(Exception):
     """Slack API エラー"""
     pass
@@ -27,165 +82,290 @@ class SlackAPIError(Exception):
 class SlackService:
     """Slack API クライアント"""
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, cache_pages: bool = False):
         """
         初期化
 
         Args:
             token: Slack OAuth Token (xoxp-*)
+            cache_pages: reactions.list のページをキャッシュするか
+                （同じインスタンスで繰り返し取得する `todo daemon` でのみ効果がある。
+                1回しか取得しない通常のCLI実行ではハッシュ計算が無駄になるため無効）
         """
         self.token = token
         self.base_url = "https://slack.com/api"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json; charset=utf-8"
-        })
-
-    def _request(
+        self.session = _SESSION
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        self.cache_pages = cache_pages
+        # reactions.list のページキャッシュ（(絵文字, カーソル, 件数) → ページ）
+        # 直近の list_reactions で取得したページのみ保持する
+        self._page_cache: Dict[Tuple[str, str, int], _ReactionPage] = {}
+
+    def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-        max_retries: int = 3
-    ) -> Dict[str, Any]:
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
         """
-        Slack APIリクエストを実行
+        Slack APIにHTTPリクエストを送信
+
+        リトライは共有セッションのHTTPAdapter（urllib3 Retry）で行う
 
         Args:
             method: HTTPメソッド（GET, POST, DELETE など）
             endpoint: APIエンドポイント
             params: クエリパラメータ
             json_data: JSONボディ
-            max_retries: 最大リトライ回数
+            headers: 追加のリクエストヘッダー
 
         Returns:
-            Dict[str, Any]: APIレスポンス
+            requests.Response: HTTPレスポンス
 
         Raises:
-            SlackAPIError: API呼び出し失敗時
+            SlackAPIError: 通信失敗時
         """
         url = f"{self.base_url}/{endpoint}"
+        request_headers = self._auth_headers
+        if headers:
+            request_headers = {**self._auth_headers, **headers}
 
-        for attempt in range(max_retries):
-            try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    timeout=10
-                )
-                response.raise_for_status()
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                # ボディはorjsonでエンコード（Content-Typeはセッションで設定済み）
+                data=orjson.dumps(json_data) if json_data is not None else None,
+                headers=request_headers,
+                timeout=10
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise SlackAPIError(f"Request failed: {e}")
+        return response
 
-                data = response.json()
+    def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Slack APIのレスポンスをパース
 
-                # Slack API のエラーチェック
-                if not data.get("ok"):
-                    error = data.get("error", "unknown_error")
-                    raise SlackAPIError(f"Slack API error: {error}")
+        Args:
+            response: HTTPレスポンス
 
-                return data
+        Returns:
+            Dict[str, Any]: APIレスポンス
 
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    # リトライ前に待機（exponential backoff）
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
-                    continue
-                raise SlackAPIError(f"Request failed: {e}")
+        Raises:
+            SlackAPIError: レスポンス不正、またはSlack APIがエラーを返した場合
+        """
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise SlackAPIError(f"Invalid response: {e}")
 
-        raise SlackAPIError("Max retries exceeded")
+        # Slack API のエラーチェック
+        if not data.get("ok"):
+            error = data.get("error", "unknown_error")
+            raise SlackAPIError(f"Slack API error: {error}")
 
-    def list_reactions(self, emoji: str = "eyes", limit: int = 50) -> List[SlackReactionItem]:
+        return data
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
-        特定の絵文字リアクションを付けたアイテムを取得
+        Slack APIリクエストを実行
 
         Args:
-            emoji: 絵文字名（例：eyes, memo, white_check_mark）
-            limit: 取得件数（デフォルト50）
+            method: HTTPメソッド（GET, POST, DELETE など）
+            endpoint: APIエンドポイント
+            params: クエリパラメータ
+            json_data: JSONボディ
 
         Returns:
-            List[SlackReactionItem]: リアクション付きアイテムのリスト
+            Dict[str, Any]: APIレスポンス
 
         Raises:
             SlackAPIError: API呼び出し失敗時
         """
-        try:
-            data = self._request(
-                method="GET",
-                endpoint="reactions.list",
-                params={"limit": limit, "full": "true"}
-            )
+        response = self._send(method, endpoint, params=params, json_data=json_data)
+        return self._parse_response(response)
 
-            reaction_items = []
-            for item in data.get("items", []):
-                # メッセージタイプのアイテムのみ処理
-                if item.get("type") != "message":
-                    continue
+    def list_reactions(
+        self,
+        emoji: str = "eyes",
+        page_limit: int = 200,
+        max_pages: int = 5
+    ) -> Tuple[List[SlackReactionItem], bool]:
+        """
+        特定の絵文字リアクションを付けたアイテムを取得
 
-                message = item.get("message", {})
-                reactions = message.get("reactions", [])
+        next_cursor をたどって全ページを取得する（最大 max_pages ページ）。
+        max_pages に達しても次ページが残っている場合は、取得結果が途中までであることを返す
 
-                # 指定された絵文字のリアクションがあるかチェック
-                has_target_emoji = any(
-                    r.get("name") == emoji and self._is_user_reacted(r)
-                    for r in reactions
-                )
+        Args:
+            emoji: 絵文字名（例：eyes, memo, white_check_mark）
+            page_limit: 1ページあたりの取得件数（デフォルト200）
+            max_pages: 最大取得ページ数（デフォルト5）
 
-                if not has_target_emoji:
-                    continue
+        Returns:
+            Tuple[List[SlackReactionItem], bool]: (リアクション付きアイテムのリスト, 途中で打ち切ったか)
 
-                # メッセージテキストを取得
-                title = message.get("text", "")
-                if not title:
-                    title = "Untitled"
+        Raises:
+            SlackAPIError: API呼び出し失敗時
+        """
+        try:
+            reaction_items: List[SlackReactionItem] = []
+            # 今回取得したページ（カーソルはリアクションの増減で変わるため、古いページは破棄する）
+            sweep: Dict[Tuple[str, str, int], _ReactionPage] = {}
+            cursor = ""
+            for _ in range(max_pages):
+                params = {"limit": page_limit, "full": "true"}
+                if cursor:
+                    params["cursor"] = cursor
 
-                # チャンネル情報を取得
-                channel_id = item.get("channel", "")
-                message_ts = message.get("ts", "")
+                page = self._fetch_reactions_page(params, emoji, sweep)
+                reaction_items.extend(page.items)
 
-                # パーマリンクを構築
-                permalink = message.get("permalink")
-                if not permalink and channel_id and message_ts:
-                    # パーマリンクがない場合は構築
-                    ts_for_url = message_ts.replace(".", "")
-                    permalink = f"https://slack.com/archives/{channel_id}/p{ts_for_url}"
-
-                if not permalink:
-                    continue
-
-                reaction_item = SlackReactionItem(
-                    message_url=permalink,
-                    title=title[:100],  # タイトルを100文字に制限
-                    timestamp=float(message_ts) if message_ts else 0.0,
-                    channel_id=channel_id,
-                    message_ts=message_ts
-                )
-                reaction_items.append(reaction_item)
+                # 次ページのカーソル（空なら最終ページ）
+                cursor = page.next_cursor
+                if not cursor:
+                    break
+
+            if self.cache_pages:
+                self._page_cache = sweep
 
-            return reaction_items
+            # カーソルが残っている = max_pages で打ち切った
+            return reaction_items, bool(cursor)
 
         except SlackAPIError:
             raise
         except Exception as e:
             raise SlackAPIError(f"Failed to list reactions: {e}")
 
-    def _is_user_reacted(self, reaction: Dict[str, Any]) -> bool:
+    def _fetch_reactions_page(
+        self,
+        params: Dict[str, Any],
+        emoji: str,
+        sweep: Dict[Tuple[str, str, int], "_ReactionPage"]
+    ) -> "_ReactionPage":
         """
-        認証ユーザーがリアクションしているかチェック
+        reactions.list の1ページを取得（前回から変化がなければパースを省略）
+
+        ページキャッシュが有効な場合、ETagがあれば If-None-Match で条件付き取得し、
+        304なら前回の結果を返す。Slackが304を返さない場合も、レスポンス本文の
+        ハッシュが前回と一致すればJSONパースとアイテム生成を省略する
 
         Args:
-            reaction: リアクションオブジェクト
+            params: クエリパラメータ
+            emoji: 絵文字名
+            sweep: 今回の取得で得たページの格納先
 
         Returns:
-            bool: ユーザーがリアクションしている場合True
+            _ReactionPage: ページの取得結果
+        """
+        key = (emoji, params.get("cursor", ""), params["limit"])
+        cached = self._page_cache.get(key)
+
+        headers = None
+        if cached is not None and cached.etag:
+            headers = {"If-None-Match": cached.etag}
+
+        response = self._send(method="GET", endpoint="reactions.list", params=params, headers=headers)
+        if cached is not None and response.status_code == 304:
+            sweep[key] = cached
+            return cached
+
+        digest = b""
+        if self.cache_pages:
+            digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            if cached is not None and cached.digest == digest:
+                cached.etag = response.headers.get("ETag", cached.etag)
+                sweep[key] = cached
+                return cached
+
+        data = self._parse_response(response)
+        page = _ReactionPage(
+            etag=response.headers.get("ETag"),
+            digest=digest,
+            items=self._parse_reaction_items(data.get("items", []), emoji),
+            next_cursor=data.get("response_metadata", {}).get("next_cursor", "")
+        )
+        sweep[key] = page
+        return page
+
+    def _parse_reaction_items(
+        self,
+        items: List[Dict[str, Any]],
+        emoji: str
+    ) -> List[SlackReactionItem]:
         """
-        # reactions.listは認証ユーザーのリアクションのみ返すため、
-        # usersリストに自分が含まれているかチェック
-        users = reaction.get("users", [])
-        return len(users) > 0
+        reactions.list の items から指定絵文字のメッセージを抽出
+
+        Args:
+            items: APIレスポンスの items
+            emoji: 絵文字名
+
+        Returns:
+            List[SlackReactionItem]: リアクション付きアイテムのリスト
+        """
+        reaction_items = []
+        for item in items:
+            # メッセージタイプのアイテムのみ処理
+            if item.get("type") != "message":
+                continue
+
+            message = item.get("message", {})
+            reactions = message.get("reactions", [])
+
+            # 指定された絵文字のリアクションがあるかチェック
+            # reactions.listは認証ユーザーのリアクションのみ返すため、
+            # usersが空でなければ自分がリアクションしている
+            reactions_by_name = {r.get("name"): r for r in reactions}
+            target = reactions_by_name.get(emoji)
+            if not target or not target.get("users"):
+                continue
+
+            # メッセージテキスト・タイムスタンプを取得
+            # （通常は両方とも含まれるため、itemgetterで一度に取り出す）
+            try:
+                title, message_ts = _MESSAGE_FIELDS(message)
+            except KeyError:
+                title = message.get("text", "")
+                message_ts = message.get("ts", "")
+            if not title:
+                title = "Untitled"
+
+            # チャンネル情報を取得
+            channel_id = item.get("channel", "")
+
+            # パーマリンクを構築
+            permalink = message.get("permalink")
+            if not permalink and channel_id and message_ts:
+                # パーマリンクがない場合は構築（tsの "." を除去して埋め込む）
+                permalink = _PERMALINK_TMPL(
+                    {"cid": channel_id, "ts": message_ts.translate(_NO_DOT)}
+                )
+
+            if not permalink:
+                continue
+
+            reaction_item = SlackReactionItem(
+                message_url=permalink,
+                title=title[:100],  # タイトルを100文字に制限
+                timestamp=float(message_ts) if message_ts else 0.0,
+                channel_id=channel_id,
+                message_ts=message_ts
+            )
+            reaction_items.append(reaction_item)
+
+        return reaction_items
 
     def remove_reaction(self, emoji: str, channel: str, timestamp: str) -> bool:
         """
@@ -2,6 +2,7 @@
 タスク一覧表示ビュー
 Phase 1: MVP - 表形式でのタスク表示
 """
+import sys
 from typing import List
 from todo_cli.core.models import Task
 from todo_cli.core.utils import format_date, truncate_text
@@ -19,26 +20,33 @@ def render_task_list(tasks: List[Task], show_all: bool = False) -> None:
         print("タスクがありません")
         return
 
-    # ヘッダー表示
-    print(f"{'ID':<4} | {'タイトル':<40} | {'期日':<8}")
-    print("-" * 60)
+    # 出力は1行ずつprintせず、まとめて1回で書き込む
+    # ヘッダー
+    lines: List[str] = [
+        f"{'ID':<4} | {'タイトル':<40} | {'期日':<8}",
+        "-" * 60,
+    ]
 
-    # タスク表示
+    # タスク（件数の集計も同じループで行う）
+    pending_count = 0
+    done_count = 0
     for task in tasks:
+        if task.is_done():
+            done_count += 1
+        elif task.is_pending():
+            pending_count += 1
         title = truncate_text(task.title, max_length=40)
         due = format_date(task.due)
-        status_marker = "✓" if task.is_done() else " "
 
-        print(f"{task.id:<4} | {title:<40} | {due:<8}")
-
-    # 統計情報表示
-    pending_count = sum(1 for t in tasks if t.is_pending())
-    done_count = sum(1 for t in tasks if t.is_done())
+        lines.append(f"{task.id:<4} | {title:<40} | {due:<8}")
 
+    # 統計情報
     if show_all:
-        print(f"\n未完: {pending_count}件 | 完了: {done_count}件")
+        lines.append(f"\n未完: {pending_count}件 | 完了: {done_count}件")
     else:
-        print(f"\n未完: {pending_count}件")
+        lines.append(f"\n未完: {pending_count}件")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def render_task_list_with_status(tasks: List[Task]) -> None:
@@ -52,22 +60,33 @@ def render_task_list_with_status(tasks: List[Task]) -> None:
         print("タスクがありません")
         return
 
-    # ヘッダー表示
-    print(f"{'ID':<4} | {'タイトル':<40} | {'期日':<8} | {'状態':<4}")
-    print("-" * 70)
+    # 出力は1行ずつprintせず、まとめて1回で書き込む
+    # ヘッダー
+    lines: List[str] = [
+        f"{'ID':<4} | {'タイトル':<40} | {'期日':<8} | {'状態':<4}",
+        "-" * 70,
+    ]
 
-    # タスク表示
+    # タスク（件数の集計も同じループで行う）
+    pending_count = 0
+    done_count = 0
     for task in tasks:
+        if task.is_done():
+            done_count += 1
+            status = "完了"
+        else:
+            if task.is_pending():
+                pending_count += 1
+            status = "未完"
         title = truncate_text(task.title, max_length=40)
         due = format_date(task.due)
-        status = "完了" if task.is_done() else "未完"
 
-        print(f"{task.id:<4} | {title:<40} | {due:<8} | {status:<4}")
+        lines.append(f"{task.id:<4} | {title:<40} | {due:<8} | {status:<4}")
+
+    # 統計情報
+    lines.append(f"\n未完: {pending_count}件 | 完了: {done_count}件")
 
-    # 統計情報表示
-    pending_count = sum(1 for t in tasks if t.is_pending())
-    done_count = sum(1 for t in tasks if t.is_done())
-    print(f"\n未完: {pending_count}件 | 完了: {done_count}件")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def render_task_detail(task: Task) -> None:
@@ -2,18 +2,21 @@
 サマリー表示ビュー
 Phase 1: MVP - ステータスバー用1行出力
 """
+from operator import attrgetter
 from typing import List
 from todo_cli.core.models import Task
 
+# status取得用のキー（Cレベルで属性を取得）
+_STATUS_KEY = attrgetter("status")
 
-def render_summary(tasks: List[Task]) -> None:
+
+def render_summary(pending_count: int) -> None:
     """
     未完了タスク件数を1行で出力（iTerm2/tmuxステータスバー用）
 
     Args:
-        tasks: タスクのリスト
+        pending_count: 未完了タスクの件数
     """
-    pending_count = sum(1 for task in tasks if task.is_pending())
     print(f"Todo: {pending_count}件")
 
 
@@ -24,8 +27,10 @@ def render_summary_detailed(tasks: List[Task]) -> None:
     Args:
         tasks: タスクのリスト
     """
-    pending_count = sum(1 for task in tasks if task.is_pending())
-    done_count = sum(1 for task in tasks if task.is_done())
+    # statusの一覧を1回だけ作り、件数はCレベルのlist.countで数える
+    statuses = list(map(_STATUS_KEY, tasks))
+    pending_count = statuses.count("pending")
+    done_count = statuses.count("done")
     total_count = len(tasks)
 
     print(f"Todo: {pending_count}件 | 完了: {done_count}件 | 合計: {total_count}件")
@@ -41,5 +46,5 @@ def get_summary_string(tasks: List[Task]) -> str:
     Returns:
         str: サマリー文字列
     """
-    pending_count = sum(1 for task in tasks if task.is_pending())
+    pending_count = list(map(_STATUS_KEY, tasks)).count("pending")
     return f"Todo: {pending_count}件"